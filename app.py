@@ -1,8 +1,28 @@
 import os
+# Tesseract's own OpenMP threads compete with our page-level process pool (and are slower
+# than one thread on few-core CPUs); must be set before Tesseract starts. Env override wins.
+os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+import importlib.util
+import io
+import queue
+import tempfile
 import threading
+from collections import deque
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import nullcontext
+import cv2
 import fitz  # PyMuPDF
+import numpy as np
 import pytesseract
-from PIL import Image, ImageOps, ImageFilter
+from PIL import Image
+try:
+    from tesserocr import PyTessBaseAPI, OEM
+except ImportError:  # optional: fall back to the pytesseract CLI wrapper
+    PyTessBaseAPI = None
+# Optional GPU engine; only imported when used, since importing paddle is slow and heavy
+PADDLE_AVAILABLE = importlib.util.find_spec("paddleocr") is not None
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 
@@ -16,42 +36,116 @@ from xml.sax.saxutils import escape as xml_escape
 DEFAULT_OUTPUT_FOLDER = "output_files"
 DEFAULT_TESSERACT_PATH = r"C:\Program Files\Tesseract-OCR\tesseract.exe"
 DEFAULT_OCR_LANG = "eng+msa"   # English + Malay
+DEFAULT_OCR_ENGINE = "tesseract"  # "tesseract" (CPU) or "paddle" (GPU PaddleOCR)
 DEFAULT_PDF_DPI = 300          # Good balance for speed/accuracy
+DEFAULT_MIN_PAGE_PX = 1400     # Render small pages up to this short side (0 = off)
+MIN_TEXT_LAYER_CHARS = 50      # Non-space chars for a page's own text layer to be trusted
+OCR_PSM = 6                    # Tesseract page segmentation mode (uniform block of text)
+TESS_CLI_CONFIG = f"--psm {OCR_PSM} --oem 3 -c preserve_interword_spaces=1"
+DEFAULT_OCR_WORKERS = max(1, (os.cpu_count() or 2) // 2)
+STORE_SHRINK_EVERY = 4         # pages between MuPDF cache flushes in a worker
+PIPELINE_DEPTH = 2             # preprocessed pages buffered ahead of OCR (caps RAM)
 
 # ========== PREPROCESS + OCR ==========
-def _preprocess_for_ocr(img: Image.Image, upscale=1.5) -> Image.Image:
+_LEVELS = np.arange(256, dtype=np.float64)
+
+def _otsu_threshold(hist: np.ndarray) -> int:
+    """Otsu's threshold for a 256-bin histogram (maximizes between-class variance)."""
+    p = hist.astype(np.float64)
+    w0 = np.cumsum(p)              # pixels at or below each level
+    w1 = w0[-1] - w0
+    s0 = np.cumsum(p * _LEVELS)
+    m0 = s0 / np.maximum(w0, 1)
+    m1 = (s0[-1] - s0) / np.maximum(w1, 1)
+    return int(np.argmax(w0 * w1 * (m0 - m1) ** 2))
+
+def _preprocess_for_ocr(arr: np.ndarray) -> Image.Image:
     """
-    Fast, light preprocessing:
-      - upscale if page small
-      - grayscale + autocontrast
-      - global threshold
-      - light denoise + sharpen
+    Fast, light preprocessing (NumPy/OpenCV, on the grayscale uint8 page buffer):
+      - Otsu global threshold (one histogram pass + one LUT pass)
+      - light denoise
+    Returns a 1-bit image: Tesseract gets exactly what it would binarize to anyway,
+    and the PNG pytesseract writes is ~8× smaller.
+    Small pages are already rendered at OCR size by _render_page, so no resampling here.
     """
-    w, h = img.size
-    if min(w, h) < 1400:
-        img = img.resize((int(w * upscale), int(h * upscale)), Image.LANCZOS)
-    g = ImageOps.grayscale(img)
-    g = ImageOps.autocontrast(g)
-    bw = g.point(lambda x: 255 if x > 180 else 0)
-    bw = bw.filter(ImageFilter.MedianFilter(3)).filter(ImageFilter.SHARPEN)
-    return bw
+    t = _otsu_threshold(np.bincount(arr.ravel(), minlength=256))
+    lut = ((_LEVELS > t) * 255).astype(np.uint8)
+    bw = lut[arr]
+    bw = cv2.medianBlur(bw, 3)
+    return Image.fromarray(bw).convert("1", dither=Image.Dither.NONE)
+
+_api = None
+_api_lang = None
+
+def _tess_api(lang: str):
+    """Per-process tesserocr instance; the language model is only reloaded when `lang` changes."""
+    global _api, _api_lang
+    if _api is None or _api_lang != lang:
+        if _api is not None:
+            _api.End()
+        tessdata = os.path.join(os.path.dirname(pytesseract.pytesseract.tesseract_cmd), "tessdata")
+        kwargs = {"path": tessdata + os.sep} if os.path.isdir(tessdata) else {}
+        _api = PyTessBaseAPI(lang=lang, psm=OCR_PSM, oem=OEM.DEFAULT, **kwargs)
+        _api.SetVariable("preserve_interword_spaces", "1")
+        _api_lang = lang
+    return _api
 
 def _ocr_page_image(img: Image.Image, lang: str) -> str:
-    # Single reliable config for documents
-    cfg = "--psm 4 --oem 3 -c preserve_interword_spaces=1"
-    text = pytesseract.image_to_string(img, lang=lang, config=cfg)
+    if PyTessBaseAPI is not None:
+        # In-process: no subprocess launch, temp file or model reload per page
+        api = _tess_api(lang)
+        api.SetImage(img)
+        text = api.GetUTF8Text()
+    else:
+        # Single reliable config for documents
+        text = pytesseract.image_to_string(img, lang=lang, config=TESS_CLI_CONFIG)
     return (text or "").strip()
 
-def _render_page(doc, page_index: int, dpi: int) -> Image.Image:
+_paddle = None
+_paddle_lang = None
+# Tesseract language codes → PaddleOCR model names (first listed language wins)
+_PADDLE_LANGS = {"eng": "en", "msa": "ms", "chi_sim": "ch", "chi_tra": "chinese_cht",
+                 "tam": "ta", "ind": "id", "jpn": "japan", "kor": "korean"}
+
+def _paddle_ocr(lang: str):
+    """Per-process PaddleOCR model (GPU), rebuilt only when `lang` changes."""
+    global _paddle, _paddle_lang
+    from paddleocr import PaddleOCR
+    plang = _PADDLE_LANGS.get(lang.split("+")[0], "en")
+    if _paddle is None or _paddle_lang != plang:
+        _paddle = PaddleOCR(use_angle_cls=False, lang=plang, use_gpu=True,
+                            det_db_box_thresh=0.5, show_log=False)
+        _paddle_lang = plang
+    return _paddle
+
+def _ocr_page_paddle(arr: np.ndarray, lang: str) -> str:
+    result = _paddle_ocr(lang).ocr(arr, cls=False)
+    lines = (result or [None])[0] or []  # None when no text was detected
+    return "\n".join(text for _box, (text, _score) in lines).strip()
+
+def _render_page(doc, page_index: int, dpi: int, min_px: int = DEFAULT_MIN_PAGE_PX) -> np.ndarray:
+    """
+    Render straight to 8-bit grayscale: 1 byte/pixel and no RGB→L conversion.
+    If the short side would come out below `min_px`, MuPDF renders at that size directly
+    rather than us upscaling the pixmap afterwards.
+    """
     page = doc.load_page(page_index)
     zoom = dpi / 72.0
-    pix = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), alpha=False)
-    return Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
+    short_side = min(page.rect.width, page.rect.height)  # points
+    if min_px and 0 < short_side * zoom < min_px:
+        zoom = min_px / short_side
+    pix = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), colorspace=fitz.csGRAY, alpha=False)
+    arr = np.frombuffer(pix.samples, dtype=np.uint8).reshape(pix.height, pix.stride)[:, :pix.width]
+    pix = None
+    return arr
 
 # ========== SAVE TEXT AS PDF/TXT ==========
+_PRE_STYLE = ParagraphStyle("Pre", fontName="Helvetica", fontSize=10, leading=14)
+
 def save_text_as_pdf(text, output_pdf_path, title=None):
+    buf = io.BytesIO()  # build in memory, then one write instead of ReportLab's many small ones
     doc = SimpleDocTemplate(
-        output_pdf_path,
+        buf,
         pagesize=A4,
         leftMargin=20*mm,
         rightMargin=20*mm,
@@ -59,42 +153,253 @@ def save_text_as_pdf(text, output_pdf_path, title=None):
         bottomMargin=15*mm,
         title=title or os.path.basename(output_pdf_path)
     )
-    pre_style = ParagraphStyle("Pre", fontName="Helvetica", fontSize=10, leading=14)
-    safe_text = xml_escape((text or "").replace("\r\n", "\n"))
-
-    chunks = [c.strip() for c in safe_text.split("\n\n")] or ["(No text extracted.)"]
     flow = []
     if title:
-        flow.append(XPreformatted(xml_escape(title), pre_style))
-        flow.append(Spacer(1, 6))
-    for c in chunks:
-        if c:
-            flow.append(XPreformatted(c, pre_style))
-            flow.append(Spacer(1, 6))
+        flow += [XPreformatted(xml_escape(title), _PRE_STYLE), Spacer(1, 6)]
+    # Escape per paragraph instead of building an escaped copy of the whole text.
+    # xml_escape's three str.replace calls are C-level scans; str.translate with a multi-char
+    # mapping takes CPython's slow path and is ~20× slower on text containing &, < or >.
+    chunks = (c.strip() for c in (text or "").replace("\r\n", "\n").split("\n\n"))
+    flow += [f for c in chunks if c for f in (XPreformatted(xml_escape(c), _PRE_STYLE), Spacer(1, 6))]
     doc.build(flow)
+    Path(output_pdf_path).write_bytes(buf.getvalue())
 
 def save_text_as_txt(text, output_txt_path):
-    with open(output_txt_path, "w", encoding="utf-8", errors="ignore") as f:
-        f.write(text if text else "(No text extracted.)")
+    Path(output_txt_path).write_bytes((text if text else "(No text extracted.)").encode("utf-8", "replace"))
 
 # ========== FORCE-OCR HELPERS ==========
-def extract_text_pages_force_ocr(pdf_path, dpi=DEFAULT_PDF_DPI, ocr_lang=DEFAULT_OCR_LANG, log=lambda *_: None):
+_pages_since_shrink = 0
+
+def _init_worker(tesseract_cmd):
+    # Spawned workers don't inherit the tesseract path chosen in the GUI.
+    # OCR models load on the first task instead (_tess_api/_paddle_ocr cache them per process),
+    # so e.g. a bad language comes back through the future rather than breaking the pool.
+    pytesseract.pytesseract.tesseract_cmd = tesseract_cmd
+
+def _iter_preprocessed(pdf_path, page_indices, dpi, min_px, preprocess=True):
+    """
+    Render → preprocess the given pages from one open document.
+    Yields (page_index, image); fitz objects can't be pickled, so workers open their own doc.
+    With preprocess=False the raw grayscale array is yielded instead.
+    """
+    global _pages_since_shrink
+    with fitz.open(pdf_path) as doc:
+        for i in page_indices:
+            arr = _render_page(doc, i, dpi, min_px)
+            img = _preprocess_for_ocr(arr) if preprocess else arr
+            arr = None
+
+            # Keep MuPDF's object cache from growing across a long document
+            _pages_since_shrink += 1
+            if _pages_since_shrink >= STORE_SHRINK_EVERY:
+                fitz.TOOLS.store_shrink(100)
+                _pages_since_shrink = 0
+            yield i, img
+            img = None
+
+_END = object()
+
+def _prefetch(items, depth=PIPELINE_DEPTH):
+    """
+    Producer/consumer: drain the `items` generator on a background thread through a bounded
+    queue, so the next page renders while the current one is in Tesseract (which drops the GIL).
+    """
+    q = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+
+    def put(item):
+        while not stop.is_set():
+            try:
+                q.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                pass
+
+    def produce():
+        try:
+            for item in items:
+                if stop.is_set():
+                    break
+                put((None, item))
+        except BaseException as e:
+            put((e, None))
+        finally:
+            items.close()
+            put(_END)
+
+    producer = threading.Thread(target=produce, daemon=True)
+    producer.start()
+    try:
+        while True:
+            msg = q.get()
+            if msg is _END:
+                return
+            err, item = msg
+            if err is not None:
+                raise err
+            yield item
+    finally:
+        stop.set()
+        producer.join()
+
+def _ocr_batch_cli(pdf_path, page_indices, dpi, min_px, lang):
+    """
+    pytesseract fallback: save the preprocessed pages as PNGs and OCR them all with one
+    tesseract run over an image list file, instead of one process launch per page.
+    """
+    with tempfile.TemporaryDirectory(prefix="ocr_") as tmpdir:
+        paths = []
+        for i, img in _prefetch(_iter_preprocessed(pdf_path, page_indices, dpi, min_px)):
+            path = os.path.join(tmpdir, f"p{i:04d}.png")
+            img.save(path, optimize=False)
+            paths.append(path)
+            img = None
+        list_path = os.path.join(tmpdir, "images.txt")
+        with open(list_path, "w", encoding="utf-8") as f:
+            f.write("\n".join(paths) + "\n")
+        text = pytesseract.image_to_string(list_path, lang=lang, config=TESS_CLI_CONFIG)
+
+    # Tesseract terminates every page with a form feed
+    pages = (text or "").split("\x0c")
+    return [(i, pages[n].strip() if n < len(pages) else "") for n, i in enumerate(page_indices)]
+
+def _ocr_run(pdf_path, page_indices, dpi, min_px, lang, engine):
+    """
+    Render → preprocess → OCR a run of pages.
+    Returns list[(page_index, text)].
+    """
+    if engine == "paddle":
+        # PaddleOCR's detector wants the grayscale page, not Tesseract's binarized one
+        pages = _prefetch(_iter_preprocessed(pdf_path, page_indices, dpi, min_px, preprocess=False))
+        return [(i, _ocr_page_paddle(arr, lang)) for i, arr in pages]
+    if PyTessBaseAPI is None:
+        return _ocr_batch_cli(pdf_path, page_indices, dpi, min_px, lang)
+    results = []
+    for i, img in _prefetch(_iter_preprocessed(pdf_path, page_indices, dpi, min_px)):
+        results.append((i, _ocr_page_image(img, lang)))
+        img = None
+    return results
+
+def _text_layer(page) -> str:
+    """The page's own text if it has a usable text layer (≥ MIN_TEXT_LAYER_CHARS), else ""."""
+    txt = page.get_text("text")
+    return txt.strip() if len("".join(txt.split())) >= MIN_TEXT_LAYER_CHARS else ""
+
+def _page_count(pdf_path):
+    """Worker task: page count (raises if the PDF is invalid)."""
+    with fitz.open(pdf_path) as doc:
+        return len(doc)
+
+def _ocr_pages(pdf_path, page_indices, dpi, min_px, lang, engine, force):
+    """
+    Worker task: for a run of pages, use each page's own text layer (unless `force`) and
+    render → preprocess → OCR the rest.
+    Returns list[(page_index, text, ocr_used)].
+    """
+    results, todo = [], list(page_indices)
+    if not force:
+        with fitz.open(pdf_path) as doc:
+            layers = {i: _text_layer(doc[i]) for i in page_indices}
+        results = [(i, txt, False) for i, txt in layers.items() if txt]
+        todo = [i for i in page_indices if not layers[i]]
+    if todo:
+        results += [(i, txt, True) for i, txt in _ocr_run(pdf_path, todo, dpi, min_px, lang, engine)]
+    return results
+
+def make_ocr_pool(workers=DEFAULT_OCR_WORKERS, engine=DEFAULT_OCR_ENGINE):
+    """
+    Process pool for OCR tasks. Pass it to iter_text_pages(pool=...) for several documents at
+    once to OCR them concurrently without oversubscribing the CPU.
+    """
+    if engine == "paddle":
+        workers = 1  # one model on the GPU; more processes would just contend for it
+    return ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                               initargs=(pytesseract.pytesseract.tesseract_cmd,))
+
+def iter_text_pages(pdf_path, dpi=DEFAULT_PDF_DPI, ocr_lang=DEFAULT_OCR_LANG, log=lambda *_: None,
+                    workers=DEFAULT_OCR_WORKERS, min_px=DEFAULT_MIN_PAGE_PX,
+                    engine=DEFAULT_OCR_ENGINE, force=True, pool=None):
     """
-    Minimal, force-OCR pipeline: render each page → preprocess → OCR (single config).
+    Minimal OCR pipeline: render each page → preprocess → OCR (single config).
+    Every page is OCR'd by default; with force=False, pages that already carry a text layer
+    (≥ MIN_TEXT_LAYER_CHARS) use it as-is instead.
+    Pages are OCR'd in parallel on a process pool of `workers` processes;
+    engine="paddle" uses PaddleOCR on the GPU from a single worker instead of Tesseract.
+    `pool` (from make_ocr_pool, same engine) is used instead of a private pool if given.
+    Yields one "[PAGE n]\n..." string per page, in page order, as soon as that page and all
+    pages before it are done.
+    """
+    if engine == "paddle":
+        if not PADDLE_AVAILABLE:
+            raise RuntimeError("PaddleOCR is not installed (pip install paddleocr paddlepaddle-gpu)")
+        workers = 1  # one model on the GPU; more processes would just contend for it
+
+    # All fitz work (even the page count) runs in the pool: PyMuPDF isn't thread-safe, and
+    # callers may drive several documents from threads of this process.
+    with nullcontext(pool) if pool is not None else make_ocr_pool(workers, engine) as pool:
+        total = pool.submit(_page_count, pdf_path).result()
+
+        # Runs of pages, each streamed through a worker's render→OCR pipeline.
+        # The CLI fallback gets one run per worker, i.e. one tesseract launch each.
+        runs = workers if (engine != "paddle" and PyTessBaseAPI is None) else workers * 4
+        size = max(1, -(-total // runs))
+        batches = [list(range(start, min(start + size, total))) for start in range(0, total, size)]
+
+        log(f"… {total} page(s) at {dpi} DPI on {workers} worker(s)")
+        futures = [pool.submit(_ocr_pages, pdf_path, b, dpi, min_px, ocr_lang, engine, force) for b in batches]
+        # Results are only held until every page before them has been yielded
+        pending = {}
+        next_page = done = from_layer = 0
+        try:
+            for fut in as_completed(futures):
+                for i, txt, ocr_used in fut.result():
+                    pending[i] = txt
+                    done += 1
+                    from_layer += not ocr_used
+                log(f"… {done}/{total} page(s) done" + (f", {from_layer} from text layer" if from_layer else ""))
+                while next_page in pending:
+                    # Optional: prefix a page marker inside the output (helps later debugging/search)
+                    yield f"[PAGE {next_page + 1}]\n{pending.pop(next_page)}"
+                    next_page += 1
+        except BaseException:
+            for fut in futures:
+                fut.cancel()
+            raise
+
+def extract_text_pages_force_ocr(pdf_path, *args, **kwargs):
+    """
+    List form of iter_text_pages (same options).
     Returns list[str] (one string per page).
     """
-    per_page = []
-    doc = fitz.open(pdf_path)  # raises if invalid
-    total = len(doc)
-    for i in range(total):
-        pno = i + 1
-        log(f"… page {pno}/{total}: OCR at {dpi} DPI")
-        img = _render_page(doc, i, dpi)
-        img = _preprocess_for_ocr(img)
-        txt = _ocr_page_image(img, ocr_lang)
-        # Optional: prefix a page marker inside the output (helps later debugging/search)
-        per_page.append(f"[PAGE {pno}]\n{txt}")
-    return per_page
+    return list(iter_text_pages(pdf_path, *args, **kwargs))
+
+def extract_and_write_force_ocr(pdf_path, out_path, **kwargs):
+    """
+    Streaming TXT output: each page is written to `out_path` as soon as it is ready instead of
+    collecting the whole transcript first, so memory stays at about one page of text.
+    Output matches save_text_as_txt(join_pages(...)). Returns the number of pages written.
+    Pages go to `out_path`.part first, so a failed run never leaves a truncated `out_path`.
+    """
+    n = 0
+    part_path = out_path + ".part"
+    try:
+        with open(part_path, "w", encoding="utf-8", errors="replace", newline="\n") as f:
+            # Each page is written once the next one arrives, so the last can be stripped
+            # like join_pages does (an empty last page would otherwise leave "[PAGE n]\n")
+            prev = None
+            for n, page_text in enumerate(iter_text_pages(pdf_path, **kwargs), start=1):
+                if prev is not None:
+                    f.write(prev + "\n\n")
+                prev = page_text
+                if n % 10 == 0:
+                    f.flush()
+            f.write(prev.rstrip() if prev is not None else "(No text extracted.)")
+    except BaseException:
+        try: os.remove(part_path)
+        except OSError: pass
+        raise
+    os.replace(part_path, out_path)
+    return n
 
 def join_pages(pages_text, start_idx, end_idx):
     """
@@ -116,14 +421,34 @@ class OCRTextGUI(tk.Tk):
         self.var_tesseract = tk.StringVar(value=DEFAULT_TESSERACT_PATH)
         self.var_lang = tk.StringVar(value=DEFAULT_OCR_LANG)
         self.var_dpi = tk.IntVar(value=DEFAULT_PDF_DPI)
+        self.var_min_px = tk.IntVar(value=DEFAULT_MIN_PAGE_PX)
+        self.var_engine = tk.StringVar(value=DEFAULT_OCR_ENGINE)
+        self.var_force = tk.BooleanVar(value=True)          # OCR pages that already have text
+        self.var_parallelism = tk.StringVar()
+        self.var_engine.trace_add("write", lambda *_: self.var_parallelism.set(self._parallelism_text()))
+        self.var_parallelism.set(self._parallelism_text())
 
         # Output options
         self.var_output_format = tk.StringVar(value="txt")  # "txt" or "pdf"
         self.var_chunk_enable = tk.BooleanVar(value=False)
         self.var_pages_per_chunk = tk.IntVar(value=10)      # user-defined pages per chunk
 
+        # Worker → UI: log lines and progress are handed over here and applied by _flush_log
+        # on the Tk thread, so the worker never touches (or waits on) widgets.
+        self._log_buf = deque()
+        self._progress = 0
+        self.var_progress = tk.IntVar(value=0)
+
+        # Shared OCR pool for the current run; swapped out by _renew_pool if a worker dies
+        self._pool = None
+        self._pool_args = None
+        self._pool_lock = threading.Lock()
+        self._retry_lock = threading.Lock()  # at most one crash-retry pool at a time
+        self._running = False  # a run owns the pool; Start stays disabled until it ends
+
         os.makedirs(self.var_outdir.get(), exist_ok=True)
         self._build_ui()
+        self.after(100, self._flush_log)
 
     def _build_ui(self):
         pad = {"padx": 8, "pady": 6}
@@ -151,6 +476,21 @@ class OCRTextGUI(tk.Tk):
         ttk.Label(frm_cfg, text="DPI:").grid(row=1, column=2, sticky="e", padx=6, pady=6)
         ttk.Entry(frm_cfg, textvariable=self.var_dpi, width=8).grid(row=1, column=3, sticky="w", padx=6, pady=6)
 
+        ttk.Label(frm_cfg, text="Min page size (px):").grid(row=1, column=4, sticky="e", padx=6, pady=6)
+        ttk.Entry(frm_cfg, textvariable=self.var_min_px, width=8).grid(row=1, column=5, sticky="w", padx=6, pady=6)
+
+        # OCR engine (radio)
+        ttk.Label(frm_cfg, text="OCR engine:").grid(row=4, column=0, sticky="e", padx=6, pady=6)
+        eng_frame = ttk.Frame(frm_cfg); eng_frame.grid(row=4, column=1, columnspan=3, sticky="w")
+        ttk.Radiobutton(eng_frame, text="CPU Tesseract", variable=self.var_engine, value="tesseract").pack(side="left", padx=6)
+        ttk.Radiobutton(eng_frame, text="GPU PaddleOCR", variable=self.var_engine, value="paddle",
+                        state="normal" if PADDLE_AVAILABLE else "disabled").pack(side="left", padx=6)
+
+        ttk.Checkbutton(frm_cfg, text="OCR every page (ignore existing text layer)",
+                        variable=self.var_force).grid(row=5, column=1, columnspan=3, sticky="w", padx=6, pady=6)
+
+        ttk.Label(frm_cfg, foreground="gray", textvariable=self.var_parallelism).grid(row=6, column=1, columnspan=5, sticky="w", padx=6, pady=(0, 6))
+
         # Output format (radio)
         ttk.Label(frm_cfg, text="Output format:").grid(row=2, column=0, sticky="e", padx=6, pady=6)
         fmt_frame = ttk.Frame(frm_cfg); fmt_frame.grid(row=2, column=1, columnspan=3, sticky="w")
@@ -167,10 +507,10 @@ class OCRTextGUI(tk.Tk):
 
         # Run
         frm_run = ttk.LabelFrame(self, text="Run"); frm_run.pack(fill="x", **pad)
-        self.pb = ttk.Progressbar(frm_run, mode="determinate"); self.pb.pack(fill="x", padx=6, pady=6)
+        self.pb = ttk.Progressbar(frm_run, mode="determinate", variable=self.var_progress); self.pb.pack(fill="x", padx=6, pady=6)
 
         btns = ttk.Frame(frm_run); btns.pack(fill="x")
-        ttk.Button(btns, text="Start", command=self.start).pack(side="left", padx=6, pady=6)
+        self.btn_start = ttk.Button(btns, text="Start", command=self.start); self.btn_start.pack(side="left", padx=6, pady=6)
         ttk.Button(btns, text="Open Output Folder", command=self.open_output_folder).pack(side="left", padx=6, pady=6)
 
         # Log
@@ -200,8 +540,27 @@ class OCRTextGUI(tk.Tk):
             self.var_tesseract.set(path)
 
     # --- Utilities ---
+    def _parallelism_text(self):
+        if self.var_engine.get() == "paddle":
+            return "Parallelism: 1 OCR worker process (one PaddleOCR model on the GPU)"
+        return (f"Parallelism: {DEFAULT_OCR_WORKERS} OCR worker process(es) × "
+                f"{os.environ['OMP_THREAD_LIMIT']} Tesseract thread(s) each (OMP_THREAD_LIMIT)")
+
     def log(self, msg):
-        self.txt_log.insert("end", msg + "\n"); self.txt_log.see("end"); self.update_idletasks()
+        self._log_buf.append(msg)  # thread-safe; shown by the next _flush_log
+
+    def _flush_log(self):
+        lines = []
+        while self._log_buf:
+            lines.append(self._log_buf.popleft())
+        if lines:
+            self.txt_log.insert("end", "\n".join(lines) + "\n"); self.txt_log.see("end")
+        state = "disabled" if self._running else "normal"
+        if str(self.btn_start["state"]) != state:
+            self.btn_start.config(state=state)
+        if self.var_progress.get() != self._progress:
+            self.var_progress.set(self._progress)
+        self.after(100, self._flush_log)
 
     def open_output_folder(self):
         outdir = self.var_outdir.get().strip()
@@ -223,81 +582,147 @@ class OCRTextGUI(tk.Tk):
             return
         os.makedirs(outdir, exist_ok=True)
 
-        # Configure pytesseract
+        # Configure pytesseract (not needed by the PaddleOCR engine)
         tpath = self.var_tesseract.get().strip()
         if tpath:
             pytesseract.pytesseract.tesseract_cmd = tpath
-        if not os.path.isfile(pytesseract.pytesseract.tesseract_cmd):
+        if self.var_engine.get() != "paddle" and not os.path.isfile(pytesseract.pytesseract.tesseract_cmd):
             if not messagebox.askyesno(
                 "Tesseract not found",
                 "Could not find tesseract.exe at the given path. Continue anyway?"
             ):
                 return
 
-        self.pb.config(value=0, maximum=len(self.selected_files))
+        self._progress = 0; self.var_progress.set(0)
+        self.pb.config(maximum=len(self.selected_files))
         self.txt_log.delete("1.0", "end")
 
+        self._running = True; self.btn_start.config(state="disabled")
         threading.Thread(target=self._run_worker, daemon=True).start()
 
+    def _write_chunk(self, chunk, start_page, name, outdir, fmt):
+        end_page = start_page + len(chunk) - 1
+        base = os.path.splitext(name)[0]
+        chunk_text = join_pages(chunk, 0, len(chunk))
+        if fmt == "pdf":
+            out_path = os.path.join(outdir, f"{base}_p{start_page:03d}-{end_page:03d}.pdf")
+            self.log(f"📝 Writing PDF chunk p{start_page}-{end_page}…")
+            title = f"{name} (pages {start_page}-{end_page})"
+            save_text_as_pdf(chunk_text, out_path, title=title)
+        else:
+            out_path = os.path.join(outdir, f"{base}_p{start_page:03d}-{end_page:03d}.txt")
+            self.log(f"📝 Writing TXT chunk p{start_page}-{end_page}…")
+            save_text_as_txt(chunk_text, out_path)
+        self.log(f"✅ Saved: {out_path}")
+
     def _run_worker(self):
+        try:
+            self._run_all()
+        except Exception as e:
+            self.log(f"❌ Error: {e}")
+        finally:
+            self._running = False  # _flush_log re-enables Start on the Tk thread
+
+    def _run_all(self):
         ocr_lang = self.var_lang.get().strip() or DEFAULT_OCR_LANG
         dpi = int(self.var_dpi.get()); outdir = self.var_outdir.get().strip()
+        min_px = int(self.var_min_px.get() or 0)
+        engine = self.var_engine.get()
+        force = bool(self.var_force.get())
         fmt = self.var_output_format.get().strip().lower()
         do_chunk = bool(self.var_chunk_enable.get())
         pages_per_chunk = int(self.var_pages_per_chunk.get() or 0)
-
-        for idx, pdf_path in enumerate(self.selected_files, start=1):
-            name = os.path.basename(pdf_path)
-            try:
-                self.log(f"🔍 Extracting (force OCR): {name}")
-                pages_text = extract_text_pages_force_ocr(pdf_path, dpi=dpi, ocr_lang=ocr_lang, log=self.log)
-                total_pages = len(pages_text)
-                base = os.path.splitext(name)[0]
-
-                if do_chunk and pages_per_chunk > 0:
-                    # Write multiple chunk files
-                    start_page = 1
-                    chunk_idx = 1
-                    while start_page <= total_pages:
-                        end_page = min(start_page + pages_per_chunk - 1, total_pages)
-                        # zero-based indices for slice
-                        chunk_text = join_pages(pages_text, start_page - 1, end_page)
-
-                        if fmt == "pdf":
-                            out_path = os.path.join(outdir, f"{base}_p{start_page:03d}-{end_page:03d}.pdf")
-                            self.log(f"📝 Writing PDF chunk p{start_page}-{end_page}…")
-                            title = f"{name} (pages {start_page}-{end_page})"
-                            save_text_as_pdf(chunk_text, out_path, title=title)
-                        else:
-                            out_path = os.path.join(outdir, f"{base}_p{start_page:03d}-{end_page:03d}.txt")
-                            self.log(f"📝 Writing TXT chunk p{start_page}-{end_page}…")
-                            save_text_as_txt(chunk_text, out_path)
-
-                        self.log(f"✅ Saved: {out_path}")
-                        chunk_idx += 1
-                        start_page = end_page + 1
-                else:
-                    # Single output file (all pages)
-                    full_text = join_pages(pages_text, 0, total_pages)
-                    if fmt == "pdf":
-                        out_path = os.path.join(outdir, f"{base}_text.pdf")
-                        self.log("📝 Writing PDF…")
-                        save_text_as_pdf(full_text, out_path, title=name)
-                    else:
-                        out_path = os.path.join(outdir, f"{base}.txt")
-                        self.log("📝 Writing TXT…")
-                        save_text_as_txt(full_text, out_path)
-                    self.log(f"✅ Saved: {out_path}")
-
-            except Exception as e:
-                self.log(f"❌ Error processing {name}: {e}")
-
-            self.pb.config(value=idx); self.update_idletasks()
+        files = list(self.selected_files)
+
+        # Documents run concurrently on their own threads, all feeding one shared process pool,
+        # so a batch of small PDFs keeps every OCR worker busy without oversubscribing the CPU.
+        self._pool_args = (DEFAULT_OCR_WORKERS, engine)
+        self._pool = make_ocr_pool(*self._pool_args)
+        try:
+            with ThreadPoolExecutor(max_workers=max(1, min(len(files), DEFAULT_OCR_WORKERS))) as docs:
+                opts = dict(dpi=dpi, ocr_lang=ocr_lang, min_px=min_px, engine=engine, force=force)
+                futures = [docs.submit(self._process_pdf, pdf_path, outdir, fmt, do_chunk, pages_per_chunk, opts)
+                           for pdf_path in files]
+                for idx, fut in enumerate(as_completed(futures), start=1):
+                    fut.result()
+                    self._progress = idx
+        finally:
+            with self._pool_lock:
+                self._pool.shutdown(cancel_futures=True)
+                self._pool = None
 
         self.log("\n✅ Done.")
         try: os.startfile(outdir)
         except Exception: pass
 
+    def _current_pool(self):
+        with self._pool_lock:
+            return self._pool
+
+    def _renew_pool(self, broken):
+        # Only the first document to notice a given broken pool replaces it
+        with self._pool_lock:
+            if self._pool is broken:
+                broken.shutdown(wait=False, cancel_futures=True)
+                self._pool = make_ocr_pool(*self._pool_args)
+
+    def _process_pdf(self, pdf_path, outdir, fmt, do_chunk, pages_per_chunk, opts):
+        name = os.path.basename(pdf_path)
+        self.log(f"🔍 Extracting{' (force OCR)' if opts['force'] else ''}: {name}")
+        opts = dict(opts, log=lambda msg: self.log(f"{msg} [{name}]"))
+
+        # A worker crash (corrupt PDF, OOM, …) breaks the shared pool for every document on it:
+        # swap in a fresh pool for the rest of the batch and retry each affected document once.
+        # Retries run one at a time on a single private worker, so a document that keeps
+        # crashing can't take the others down again and the CPU isn't oversubscribed; the GPU
+        # engine retries on the renewed shared pool instead to keep one model on the GPU.
+        for attempt in (1, 2):
+            retry = attempt == 2
+            shared = not retry or opts["engine"] == "paddle"
+            with self._retry_lock if retry else nullcontext():
+                pool = self._current_pool() if shared else None
+                run_opts = dict(opts, pool=pool) if shared else dict(opts, pool=None, workers=1)
+                try:
+                    self._write_outputs(pdf_path, name, outdir, fmt, do_chunk, pages_per_chunk, run_opts)
+                    return
+                except BrokenProcessPool:
+                    if pool is not None:
+                        self._renew_pool(pool)
+                    if not retry:
+                        self.log(f"⚠️ OCR worker crashed, retrying: {name}")
+                    else:
+                        self.log(f"❌ Error processing {name}: OCR worker crashed")
+                except Exception as e:
+                    self.log(f"❌ Error processing {name}: {e}")
+                    return
+
+    def _write_outputs(self, pdf_path, name, outdir, fmt, do_chunk, pages_per_chunk, opts):
+        base = os.path.splitext(name)[0]
+        if do_chunk and pages_per_chunk > 0:
+            # Write each chunk file as soon as its pages are done
+            chunk, start_page = [], 1
+            for pno, page_text in enumerate(iter_text_pages(pdf_path, **opts), start=1):
+                chunk.append(page_text)
+                if len(chunk) == pages_per_chunk:
+                    self._write_chunk(chunk, start_page, name, outdir, fmt)
+                    chunk, start_page = [], pno + 1
+            if chunk:
+                self._write_chunk(chunk, start_page, name, outdir, fmt)
+        elif fmt == "pdf":
+            # Single output file (all pages); ReportLab needs the whole text
+            pages_text = extract_text_pages_force_ocr(pdf_path, **opts)
+            full_text = join_pages(pages_text, 0, len(pages_text))
+            out_path = os.path.join(outdir, f"{base}_text.pdf")
+            self.log(f"📝 Writing PDF: {name}…")
+            save_text_as_pdf(full_text, out_path, title=name)
+            self.log(f"✅ Saved: {out_path}")
+        else:
+            # Single output file (all pages), written page by page
+            out_path = os.path.join(outdir, f"{base}.txt")
+            self.log(f"📝 Writing TXT as pages finish: {out_path}")
+            extract_and_write_force_ocr(pdf_path, out_path, **opts)
+            self.log(f"✅ Saved: {out_path}")
+
 if __name__ == "__main__":
     app = OCRTextGUI()
     app.mainloop()